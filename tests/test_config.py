@@ -0,0 +1,82 @@
+import os
+import warnings
+
+import pytest
+
+from texjam.config import load_config
+from texjam.config.meta import (
+    MetaBool,
+    MetaChoice,
+    MetaNumber,
+    MetaStr,
+    parse_meta_field,
+)
+
+
+def test_load_config_cache(tmp_path):
+    config_file = tmp_path / 'texjam.yaml'
+    config_file.write_text('name: First\nmeta:\n  title: Untitled\n')
+
+    # Repeated loads return independent copies of the same configuration
+    first = load_config(config_file)
+    second = load_config(config_file)
+    assert first == second
+    assert first is not second
+    first.name = 'Modified'
+    assert load_config(config_file).name == 'First'
+
+    # Changing the file invalidates the cached configuration
+    config_file.write_text('name: Second\nmeta: {}\n')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(config_file).name == 'Second'
+
+
+def test_load_config_shorthand_fields(tmp_path):
+    config_file = tmp_path / 'texjam.yaml'
+    config_file.write_text(
+        'name: Shorthand\n'
+        'meta:\n'
+        '  title: Untitled\n'
+        '  pages: 10\n'
+        '  scale: 1.5\n'
+        '  draft: true\n'
+        '  paper: [a4, letter]\n'
+    )
+
+    # Each field type is inferred from its default value
+    meta = load_config(config_file).meta
+    assert isinstance(meta['title'], MetaStr)
+    assert isinstance(meta['pages'], MetaNumber)
+    assert meta['pages'].is_integer
+    assert isinstance(meta['scale'], MetaNumber)
+    assert not meta['scale'].is_integer
+    assert isinstance(meta['draft'], MetaBool)
+    assert meta['draft'].default is True
+    assert isinstance(meta['paper'], MetaChoice)
+
+
+def test_number_integer_bounds():
+    # Bounds are truncated once is_integer has been validated,
+    # whatever form the flag and the bounds were given in
+    meta = parse_meta_field({'type': 'number', 'is_integer': 1, 'min_value': 2.7})
+    assert meta.min_value == 2 and type(meta.min_value) is int
+    meta = parse_meta_field(
+        {'type': 'number', 'is_integer': 'true', 'min_value': '2.5', 'max_value': 9}
+    )
+    assert (meta.min_value, meta.max_value) == (2, 9)
+
+
+def test_parse_meta_field_rejects_tuples():
+    # Tuples are not a meta field shorthand, whatever they contain
+    for field in (('x', 'y'), (('type', str, 'str'),)):
+        with pytest.raises(ValueError, match='Unknown meta field type'):
+            parse_meta_field(field)
+
+
+def test_number_integer_bounds_constructor():
+    # Building the field directly coerces the bounds as well
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        meta = MetaNumber(is_integer=True, min_value=2.7, max_value=9.9)
+    assert (meta.min_value, meta.max_value) == (2, 9)
@@ -0,0 +1,41 @@
+from texjam.render.path import TempPath
+
+
+def test_content_text_and_binary(tmp_path):
+    # UTF-8 text is decoded with newlines normalized
+    text_file = tmp_path / 'main.tex'
+    text_file.write_bytes('\\section{Résumé}\r\n'.encode())
+    text_path = TempPath(raw=text_file, rendered=text_file)
+    assert text_path.content == '\\section{Résumé}\n'
+
+    # Files containing NUL bytes are kept as bytes
+    image_file = tmp_path / 'logo.png'
+    image_file.write_bytes(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
+    image_path = TempPath(raw=image_file, rendered=image_file)
+    assert image_path.content == b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR'
+
+    # Files that are not valid UTF-8 are kept as bytes
+    latin_file = tmp_path / 'legacy.tex'
+    latin_file.write_bytes('Résumé'.encode('latin-1'))
+    latin_path = TempPath(raw=latin_file, rendered=latin_file)
+    assert latin_path.content == 'Résumé'.encode('latin-1')
+
+
+def test_binary_copy(tmp_path):
+    # Binary files are detected from their head and copied without loading
+    image_file = tmp_path / 'logo.png'
+    image_file.write_bytes(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
+    image_path = TempPath(raw=image_file, rendered=image_file)
+    assert image_path.is_binary
+    image_path.copy_to(tmp_path / 'copy.png')
+    assert (tmp_path / 'copy.png').read_bytes() == image_file.read_bytes()
+
+    # Text files are not binary, unless their content is replaced with bytes
+    text_file = tmp_path / 'main.tex'
+    text_file.write_text('\\documentclass{article}\n')
+    text_path = TempPath(raw=text_file, rendered=text_file)
+    assert not text_path.is_binary
+    text_path.content = b'\x00'
+    assert text_path.is_binary
+    text_path.copy_to(tmp_path / 'copy.tex')
+    assert (tmp_path / 'copy.tex').read_bytes() == b'\x00'
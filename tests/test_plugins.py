@@ -0,0 +1,138 @@
+import os
+
+from texjam import TexJam
+
+
+def make_template(path, class_name):
+    (path / 'src').mkdir(parents=True)
+    (path / 'plugins').mkdir()
+    (path / 'texjam.yaml').write_text('name: Plugins\nmeta: {}\n')
+    write_plugin(path, class_name)
+
+
+def write_plugin(path, class_name):
+    (path / 'plugins' / 'hooks.py').write_text(
+        'from texjam import TexJamPlugin\n'
+        '\n'
+        f'class {class_name}(TexJamPlugin):\n'
+        '    pass\n'
+    )
+
+
+def load_plugin_names(path):
+    texjam = TexJam(path, path / 'out')
+    texjam.load_plugins()
+    return [type(p).__name__ for p in texjam.plugins]
+
+
+def test_plugins_are_scoped_to_template(tmp_path):
+    make_template(tmp_path / 'first', 'FirstPlugin')
+    make_template(tmp_path / 'second', 'SecondPlugin')
+
+    # Each template only instantiates the plugins it ships,
+    # even when the plugin scripts share a name
+    assert load_plugin_names(tmp_path / 'first') == ['FirstPlugin']
+    assert load_plugin_names(tmp_path / 'second') == ['SecondPlugin']
+    assert load_plugin_names(tmp_path / 'first') == ['FirstPlugin']
+
+
+def test_plugins_reload_when_changed(tmp_path):
+    make_template(tmp_path, 'OldPlugin')
+    assert load_plugin_names(tmp_path) == ['OldPlugin']
+
+    # A changed script is executed again and replaces its old classes
+    write_plugin(tmp_path, 'NewPlugin')
+    script_file = tmp_path / 'plugins' / 'hooks.py'
+    stat = script_file.stat()
+    os.utime(script_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_plugin_names(tmp_path) == ['NewPlugin']
+
+
+def test_plugins_imported_from_shared_module(tmp_path, monkeypatch):
+    shared_dir = tmp_path / 'shared'
+    shared_dir.mkdir()
+    (shared_dir / 'shared_plugins.py').write_text(
+        'from texjam import TexJamPlugin\n'
+        '\n'
+        'class SharedPlugin(TexJamPlugin):\n'
+        '    pass\n'
+    )
+    monkeypatch.syspath_prepend(str(shared_dir))
+
+    # A template enables a shared plugin by importing it into its script
+    template_dir = tmp_path / 'template'
+    make_template(template_dir, 'LocalPlugin')
+    (template_dir / 'plugins' / 'hooks.py').write_text(
+        'from shared_plugins import SharedPlugin\n'
+    )
+    assert load_plugin_names(template_dir) == ['SharedPlugin']
+
+
+def render_with_plugin(path, script, files):
+    make_template(path, 'UnusedPlugin')
+    (path / 'plugins' / 'hooks.py').write_text(script)
+    for name, content in files.items():
+        file = path / 'src' / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content)
+
+    texjam = TexJam(path, path / 'out')
+    texjam.load_plugins()
+    texjam.metadata = {'name': 'jam'}
+    texjam.render()
+    return texjam
+
+
+def test_plugin_path_hooks(tmp_path):
+    script = (
+        'from texjam import TexJamPlugin\n'
+        '\n'
+        'class RecordingPlugin(TexJamPlugin):\n'
+        '    def on_load(self):\n'
+        '        self.events = []\n'
+        '\n'
+        '    def pre_create(self, path):\n'
+        "        self.events.append(('pre_create', path.rendered.as_posix()))\n"
+        '\n'
+        '    def on_render(self, path, rendered):\n'
+        "        self.events.append(('on_render', path.rendered.as_posix()))\n"
+        '        return rendered.upper()\n'
+        '\n'
+        '    def post_create(self, path):\n'
+        "        self.events.append(('post_create', path.rendered.as_posix()))\n"
+    )
+    files = {'a/x.txt': 'x (((name)))\n', 'b.txt': 'b\n'}
+    texjam = render_with_plugin(tmp_path, script, files)
+
+    # Hooks run for one path at a time, in sorted order
+    assert texjam.plugins[0].events == [
+        ('pre_create', 'a'),
+        ('post_create', 'a'),
+        ('pre_create', 'a/x.txt'),
+        ('on_render', 'a/x.txt'),
+        ('post_create', 'a/x.txt'),
+        ('pre_create', 'b.txt'),
+        ('on_render', 'b.txt'),
+        ('post_create', 'b.txt'),
+    ]
+    assert (tmp_path / 'out' / 'a' / 'x.txt').read_text() == 'X JAM\n'
+    assert (tmp_path / 'out' / 'b.txt').read_text() == 'B\n'
+
+
+def test_plugin_colliding_paths(tmp_path):
+    script = (
+        'from pathlib import Path\n'
+        '\n'
+        'from texjam import TempPath, TexJamPlugin\n'
+        '\n'
+        'class CollidingPlugin(TexJamPlugin):\n'
+        '    def on_paths(self, paths):\n'
+        "        paths.append(TempPath(rendered=Path('a.txt'), is_dir=False,"
+        " content='from plugin\\n'))\n"
+    )
+    files = {'a.txt': 'from template\n', 'b.txt': 'b\n'}
+    render_with_plugin(tmp_path, script, files)
+
+    # Paths rendering to the same target are written in order, the last one wins
+    assert (tmp_path / 'out' / 'a.txt').read_text() == 'from plugin\n'
+    assert (tmp_path / 'out' / 'b.txt').read_text() == 'b\n'
@@ -1,8 +1,12 @@
+from pathlib import Path
+
+import pytest
 import yaml
 from prompt_toolkit.application import create_app_session
 from prompt_toolkit.input import create_pipe_input
 from typer.testing import CliRunner
 
+from texjam import TexJam
 from texjam.cli import app
 
 runner = CliRunner()
@@ -36,3 +40,87 @@ def test_render(tmp_path):
     with yaml_file.open('r') as f:
         content = yaml.safe_load(f)
     assert content == expected_content
+
+
+def test_render_failure_leaves_no_file(tmp_path):
+    template_dir = tmp_path / 'template'
+    (template_dir / 'src').mkdir(parents=True)
+    (template_dir / 'texjam.yaml').write_text('name: Failing\nmeta: {}\n')
+    (template_dir / 'src' / 'boom.txt').write_text('before\n((( 1 // 0 )))\nafter\n')
+
+    output_dir = tmp_path / 'output'
+    texjam = TexJam(template_dir, output_dir)
+    texjam.load_plugins()
+    texjam.metadata = {}
+    with pytest.raises(ZeroDivisionError):
+        texjam.render()
+
+    # Neither the target nor a partially written file is left behind
+    assert list(output_dir.iterdir()) == []
+
+
+def make_texjam(path, jinja=None, metadata=None):
+    template_dir = path / 'template'
+    (template_dir / 'src').mkdir(parents=True)
+    (template_dir / 'texjam.yaml').write_text('name: Render\nmeta: {}\n')
+    texjam = TexJam(template_dir, path / 'output')
+    for name, value in (jinja or {}).items():
+        setattr(texjam.config.jinja, name, value)
+    texjam.load_plugins()
+    texjam.metadata = metadata or {}
+    return texjam
+
+
+@pytest.mark.parametrize(
+    ('jinja', 'source', 'expected'),
+    [
+        ({}, 'main.tex', False),
+        ({}, 'a\nb\n', False),
+        ({}, '((( 1 )))', True),
+        ({}, 'a\r\nb', True),
+        ({}, 'a\rb', True),
+        ({'newline_sequence': '\r\n'}, 'a\r\nb', False),
+        ({'newline_sequence': '\r\n'}, 'a\nb', True),
+        ({'keep_trailing_newline': False}, 'a\nb', False),
+        ({'keep_trailing_newline': False}, 'a\n', True),
+        ({'line_statement_prefix': '%%'}, '%% if true\nx\n%% endif\n', True),
+        ({'line_comment_prefix': '##'}, 'x ## note\n', True),
+        ({'line_comment_prefix': '##'}, 'x\n', False),
+    ],
+)
+def test_needs_render(tmp_path, jinja, source, expected):
+    texjam = make_texjam(tmp_path, jinja)
+    assert texjam.needs_render(source) is expected
+
+    # Skipping Jinja is only allowed when rendering would not change anything
+    rendered = texjam.compile_template(source).render()
+    assert (rendered != source) is expected
+
+
+def test_render_part_single_variable(tmp_path):
+    metadata = {
+        'count': 3,
+        'draft': True,
+        'missing': None,
+        'folder': Path('a/b'),
+        'true': 'shadowed',
+        'None': 'shadowed',
+    }
+    texjam = make_texjam(tmp_path / 'plain', metadata=metadata)
+
+    # Lone variables render like Jinja would, whatever their type
+    for part in ('(((count)))', '((( draft )))', '(((missing)))', '(((folder)))'):
+        expected = texjam.compile_template(part).render(metadata)
+        assert texjam._render_part(part) == expected
+    assert texjam._render_part('(((count)))') == '3'
+    assert texjam._render_part('(((missing)))') == 'None'
+
+    # Unknown names and Jinja literals still go through Jinja
+    assert texjam._render_part('(((unknown)))') == ''
+    assert texjam._render_part('((( true )))') == 'True'
+    assert texjam._render_part('(((None)))') == 'None'
+
+    # Autoescaping disables the shortcut
+    texjam = make_texjam(tmp_path / 'escaped', {'autoescape': True}, {'name': '<b>'})
+    assert texjam._variable_only is None
+    assert texjam._render_part('(((name)))') == '&lt;b&gt;'
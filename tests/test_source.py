@@ -0,0 +1,42 @@
+import tarfile
+import zipfile
+
+from texjam.cli.source import ArchiveSource, RemoteSource
+
+
+def test_remote_source_download(tmp_path):
+    # Build a gzipped tarball containing a minimal package
+    package_dir = tmp_path / 'package'
+    package_dir.mkdir()
+    (package_dir / 'texjam.yaml').write_text('name: Package\n')
+    archive_path = tmp_path / 'package.tar.gz'
+    with tarfile.open(archive_path, 'w:gz') as archive:
+        archive.add(package_dir, arcname='package')
+
+    # Download it through a URL
+    target = tmp_path / 'target'
+    RemoteSource(archive_path.as_uri()).download(target)
+
+    # Check that the archive was extracted into the target directory
+    config_file = target / 'package' / 'texjam.yaml'
+    assert config_file.read_text() == 'name: Package\n'
+
+
+def test_archive_source_download(tmp_path):
+    package_dir = tmp_path / 'package'
+    package_dir.mkdir()
+    (package_dir / 'texjam.yaml').write_text('name: Package\n')
+
+    # Tarballs and zip files are both extracted into the target directory
+    tar_path = tmp_path / 'package.tgz'
+    with tarfile.open(tar_path, 'w:gz') as archive:
+        archive.add(package_dir, arcname='package')
+    zip_path = tmp_path / 'package.zip'
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.write(package_dir / 'texjam.yaml', 'package/texjam.yaml')
+
+    for archive_path in (tar_path, zip_path):
+        target = tmp_path / archive_path.suffix[1:]
+        ArchiveSource(archive_path).download(target)
+        config_file = target / 'package' / 'texjam.yaml'
+        assert config_file.read_text() == 'name: Package\n'
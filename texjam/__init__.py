@@ -1,8 +1,28 @@
-from .render.executor import TexJam, TexJamPlugin
-from .render.path import TempPath
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
+if TYPE_CHECKING:
+    from .render.executor import TexJam, TexJamPlugin
+    from .render.path import TempPath
+
+__all__ = (
     'TempPath',
     'TexJam',
     'TexJamPlugin',
-]
+)
+
+_LAZY_ATTRS = {
+    'TempPath': '.render.path',
+    'TexJam': '.render.executor',
+    'TexJamPlugin': '.render.executor',
+}
+
+
+def __getattr__(name: str):
+    # resolve public names on first access so that light CLI commands do not
+    # pay for importing jinja2, pydantic and questionary
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,14 +1,11 @@
-import json
 import sys
 from importlib.metadata import version
 from pathlib import Path
 from typing import Annotated
 
 import typer
-import yaml
 from rich import print as rprint
 
-from ..render import TexJam
 from . import package as pkg
 from .source import parse_source
 
@@ -183,6 +180,13 @@ def create(
     ] = None,
 ) -> None:
     """Create a new TeXJam project using the template."""
+    # only needed here; keep them off the import path of other commands
+    import json
+
+    import yaml
+
+    from ..render import TexJam
+
     if package.startswith(('.', '/')):
         template_dir = Path(package).resolve()
     else:
@@ -198,8 +202,10 @@ def create(
         with json_file.open('r') as f:
             metadata = json.load(f)
     elif yaml_file:
+        # CSafeLoader is only available when PyYAML is built with libyaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with yaml_file.open('r') as f:
-            metadata = yaml.safe_load(f)
+            metadata = yaml.load(f, Loader=loader)
     else:
         metadata = None
 
@@ -1,3 +1,5 @@
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -22,7 +24,7 @@ def install_package(source: Source, force: bool = False) -> str:
     package_path = PACKAGE_DIR / source.name
     if package_path.exists():
         if force:
-            subprocess.run(['rm', '-rf', str(package_path)])
+            shutil.rmtree(package_path)
         else:
             raise exc.TexJamPackageAlreadyExistsException(package_name=source.name)
     source.download(package_path)
@@ -64,7 +66,7 @@ def uninstall_package(package_name: str) -> None:
     package_path = PACKAGE_DIR / package_name
     if not package_path.exists():
         raise exc.TexJamPackageNotFoundException(package_name=package_name)
-    subprocess.run(['rm', '-rf', str(package_path)])
+    shutil.rmtree(package_path)
 
 
 def list_installed_packages() -> list[str]:
@@ -73,8 +75,12 @@ def list_installed_packages() -> list[str]:
     Returns:
         list[str]: A list of installed package names.
     """
-    ensure_install_dir()
-    return [p.name for p in PACKAGE_DIR.iterdir() if p.is_dir()]
+    try:
+        with os.scandir(PACKAGE_DIR) as entries:
+            # DirEntry.is_dir uses the type reported by the directory listing
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
 
 
 def get_package_path(package_name: str) -> Path:
@@ -1,8 +1,12 @@
 import shutil
 import subprocess
+import tarfile
+import zipfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+_ARCHIVE_SUFFIXES = ('.tar.gz', '.tgz', '.zip')
+
 
 class Source(ABC):
     """Abstract base class for different types of package sources."""
@@ -44,7 +48,13 @@ class ArchiveSource(Source):
         self._archive_path = archive_path
 
     def download(self, path: Path) -> None:
-        subprocess.run(['tar', '-xzf', str(self._archive_path), '-C', str(path)])
+        if self._archive_path.suffix == '.zip':
+            # zipfile already drops absolute and parent-relative member paths
+            with zipfile.ZipFile(self._archive_path) as archive:
+                archive.extractall(path)
+        else:
+            with tarfile.open(self._archive_path, 'r:*') as archive:
+                archive.extractall(path, filter='data')
 
     @property
     def name(self) -> str:
@@ -58,17 +68,15 @@ class RemoteSource(Source):
         self._url = url
 
     def download(self, path: Path) -> None:
-        subprocess.run([
-            'curl',
-            '-L',
-            self._url,
-            '|',
-            'tar',
-            '-xzf',
-            '-',
-            '-C',
-            str(path),
-        ])
+        # imported here: urllib.request pulls in http.client and ssl
+        import urllib.request
+
+        # stream the gzipped tarball straight into the extractor
+        with (
+            urllib.request.urlopen(self._url) as response,
+            tarfile.open(fileobj=response, mode='r|gz') as archive,
+        ):
+            archive.extractall(path, filter='data')
 
     @property
     def name(self) -> str:
@@ -106,9 +114,9 @@ def parse_source(source: str) -> Source:
     elif source.startswith('gl:'):
         repo_url = f'git@gitlab.com:{source[len("gl:") :]}.git'
         return RepositorySource(repo_url)
-    elif source.startswith('http://') or source.startswith('https://'):
+    elif source.startswith(('http://', 'https://')):
         return RemoteSource(source)
-    elif source.endswith(('.tar.gz', '.tgz', '.zip')):
+    elif source.endswith(_ARCHIVE_SUFFIXES):
         return ArchiveSource(Path(source))
     else:
         return LocalSource(Path(source))
@@ -1,4 +1,4 @@
-from .config import JinjaConfig, TemplateConfig, TexJamConfig
+from .config import JinjaConfig, TemplateConfig, TexJamConfig, load_config
 from .meta import MetaField, MetaFields, Prompter
 
 __all__ = [
@@ -8,4 +8,5 @@ __all__ = [
     'MetaField',
     'MetaFields',
     'Prompter',
+    'load_config',
 ]
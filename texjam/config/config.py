@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -41,3 +43,38 @@ class TexJamConfig(TemplateConfig):
     jinja: JinjaConfig = Field(default_factory=JinjaConfig)
 
     model_config = ConfigDict(extra='ignore')
+
+
+_config_cache: dict[Path, tuple[int, int, Any]] = {}
+
+
+def load_config(config_file: Path) -> TexJamConfig:
+    """Load and validate a TeXJam configuration file.
+
+    Parsed configuration data is cached per file and reused as long as the
+    file's modification time and size are unchanged.
+
+    Args:
+        config_file (Path): The JSON or YAML configuration file.
+    Returns:
+        TexJamConfig: The validated configuration.
+    """
+    config_file = config_file.resolve()
+    stat = config_file.stat()
+    cached = _config_cache.get(config_file)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        config_data = cached[2]
+    else:
+        with config_file.open('r', encoding='utf-8') as f:
+            if config_file.suffix in ['.yaml', '.yml']:
+                # only templates with a YAML config pay for importing PyYAML
+                import yaml
+
+                # CSafeLoader is only available when PyYAML is built with libyaml
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                config_data = yaml.load(f, Loader=loader)
+            else:
+                config_data = json.load(f)
+        _config_cache[config_file] = (stat.st_mtime_ns, stat.st_size, config_data)
+
+    return TexJamConfig.model_validate(config_data)
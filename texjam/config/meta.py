@@ -1,22 +1,32 @@
 from __future__ import annotations
 
 import keyword
+import sys
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, Callable
 
 import questionary
 import typer
-from pydantic import BaseModel, WrapValidator, model_validator
+from pydantic import BaseModel, ConfigDict, PlainValidator, model_validator
 
 if TYPE_CHECKING:
     from ..render.executor import TexJam
 
 
 class MetaBase(BaseModel, ABC):
+    """Base class for meta field definitions.
+
+    Meta fields are immutable once validated. Plugins that need a different
+    field, e.g. another default, must build a new one with `model_copy`.
+    """
+
     prompt: str | None = None
     required: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
     def _question_validate(self, answer: Any) -> None:
         if self.required and answer == '':
             raise questionary.ValidationError(
@@ -114,35 +124,34 @@ class MetaNumber(MetaBase):
             raise ValueError('min_value cannot be greater than max_value.')
 
         if data.is_integer:
-            if data.min_value is not None:
-                try:
-                    data.min_value = int(data.min_value)
-                except ValueError:
-                    raise ValueError('min_value must be an integer.')
-            if data.max_value is not None:
-                try:
-                    data.max_value = int(data.max_value)
-                except ValueError:
-                    raise ValueError('max_value must be an integer.')
+            for key in ('min_value', 'max_value'):
+                value = getattr(data, key)
+                if value is not None and type(value) is not int:
+                    try:
+                        value = int(value)
+                    except (ValueError, OverflowError):
+                        raise ValueError(f'{key} must be an integer.') from None
+                    # the model is frozen; this is still part of its validation
+                    object.__setattr__(data, key, value)
         return data
 
+    @cached_property
+    def _cast(self) -> Callable[[Any], float | int]:
+        return int if self.is_integer else float
+
     def _question_validate(self, answer: Any) -> None:
         super()._question_validate(answer)
 
-        if self.is_integer:
-            try:
-                val = int(answer)
-            except ValueError:
-                raise questionary.ValidationError(
-                    message='Input must be an integer.',
-                )
-        else:
-            try:
-                val = float(answer)
-            except ValueError:
-                raise questionary.ValidationError(
-                    message='Input must be a number.',
-                )
+        try:
+            val = self._cast(answer)
+        except ValueError:
+            raise questionary.ValidationError(
+                message=(
+                    'Input must be an integer.'
+                    if self.is_integer
+                    else 'Input must be a number.'
+                ),
+            ) from None
         if self.min_value is not None and val < self.min_value:
             raise questionary.ValidationError(
                 message=f'Input must be at least {self.min_value}.',
@@ -179,10 +188,7 @@ class MetaNumber(MetaBase):
         }
 
     def _convert_answer(self, answer: Any) -> Any:
-        if self.is_integer:
-            return int(answer)
-        else:
-            return float(answer)
+        return self._cast(answer)
 
 
 class MetaBool(MetaBase):
@@ -321,6 +327,8 @@ class MetaSelectItem(BaseModel):
     value: str | None = None
     default: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
     @model_validator(mode='before')
     @classmethod
     def parse_string(cls, data: Any) -> Any:
@@ -329,39 +337,65 @@ class MetaSelectItem(BaseModel):
         return data
 
 
-def parse_meta_field(field: Any, handler) -> MetaField:
+_META_TYPES: dict[str, type[MetaBase]] = {
+    'str': MetaStr,
+    'number': MetaNumber,
+    'bool': MetaBool,
+    'path': MetaPath,
+    'choice': MetaChoice,
+    'select': MetaSelect,
+}
+
+_META_DEFAULTS: dict[type, Callable[[Any], MetaBase]] = {
+    str: lambda value: MetaStr(default=value),
+    int: lambda value: MetaNumber(default=value, is_integer=True),
+    float: lambda value: MetaNumber(default=value, is_integer=False),
+    bool: lambda value: MetaBool(default=value),
+    list: lambda value: MetaChoice(choices=value),
+}
+
+
+def parse_meta_field(field: Any) -> MetaField:
+    # meta fields are frozen, so equal definitions can share one instance;
+    # value types are part of the key to keep 1, 1.0 and True apart
+    if isinstance(field, dict):
+        key = tuple((name, type(value), value) for name, value in field.items())
+        parse_cached = _parse_meta_dict_cached
+    else:
+        key = field
+        parse_cached = _parse_meta_value_cached
+    try:
+        hash(key)
+    except TypeError:  # choice lists, select items
+        return _parse_meta_field(field)
+    return parse_cached(key)
+
+
+@lru_cache(maxsize=512)
+def _parse_meta_dict_cached(items: tuple[tuple[str, type, Any], ...]) -> MetaField:
+    return _parse_meta_field({name: value for name, _, value in items})
+
+
+@lru_cache(maxsize=512, typed=True)
+def _parse_meta_value_cached(value: Any) -> MetaField:
+    return _parse_meta_field(value)
+
+
+def _parse_meta_field(field: Any) -> MetaField:
     if isinstance(field, dict):
         field_type = field.get('type')
-        if field_type == 'str':
-            return MetaStr(**field)
-        elif field_type == 'number':
-            return MetaNumber(**field)
-        elif field_type == 'bool':
-            return MetaBool(**field)
-        elif field_type == 'path':
-            return MetaPath(**field)
-        elif field_type == 'choice':
-            return MetaChoice(**field)
-        elif field_type == 'select':
-            return MetaSelect(**field)
-        else:
+        if not isinstance(field_type, str) or field_type not in _META_TYPES:
             raise ValueError(f'Unknown meta field type: {field}')
+        return _META_TYPES[field_type](**field)  # type: ignore
 
-    if isinstance(field, str):
-        return MetaStr(default=field)
-    elif isinstance(field, int):
-        return MetaNumber(default=field, is_integer=True)
-    elif isinstance(field, float):
-        return MetaNumber(default=field, is_integer=False)
-    elif isinstance(field, bool):
-        return MetaBool(default=field)
-    elif isinstance(field, list):
-        return MetaChoice(choices=field)
-    else:
+    # exact type lookup, so that bools are not taken for ints
+    factory = _META_DEFAULTS.get(type(field))
+    if factory is None:
         raise ValueError(f'Unknown meta field type: {field}')
+    return factory(field)
 
 
-def validate_meta_fields(fields: Any, handler) -> MetaFields:
+def validate_meta_fields(fields: Any) -> MetaFields:
     if not isinstance(fields, dict):
         raise ValueError('Meta fields must be a dictionary.')
     validated_fields: MetaFields = {}
@@ -370,21 +404,35 @@ def validate_meta_fields(fields: Any, handler) -> MetaFields:
             raise ValueError(f'Meta field name must be a string: {name}')
         if not name.isidentifier() or keyword.iskeyword(name):
             raise ValueError(f'Invalid meta field name: {name}')
-        validated_fields[name] = parse_meta_field(field, None)
+        # metadata keys are looked up repeatedly while rendering
+        validated_fields[sys.intern(name)] = parse_meta_field(field)
     return validated_fields
 
 
 type MetaField = Annotated[
     MetaStr | MetaNumber | MetaBool | MetaPath | MetaChoice | MetaSelect,
-    WrapValidator(parse_meta_field),
+    PlainValidator(
+        parse_meta_field,
+        json_schema_input_type=(
+            MetaStr | MetaNumber | MetaBool | MetaPath | MetaChoice | MetaSelect
+        ),
+    ),
 ]
 
 type MetaFields = Annotated[
     dict[str, MetaField],
-    WrapValidator(validate_meta_fields),
+    PlainValidator(
+        validate_meta_fields,
+        json_schema_input_type=dict[str, MetaField],
+    ),
 ]
 
 
+@lru_cache(maxsize=256)
+def _humanize(name: str) -> str:
+    return name.replace('_', ' ').capitalize()
+
+
 class Prompter:
     def __init__(self, texjam: TexJam) -> None:
         self.texjam = texjam
@@ -392,12 +440,15 @@ class Prompter:
     def _render_value(self, value: str | None) -> str | None:
         if value is None:
             return None
-        template = self.texjam.env.from_string(value)
+        if not self.texjam.needs_render(value):
+            # static value, nothing to render
+            return value
+        template = self.texjam.compile_template(value)
         rendered = template.render(self.texjam.metadata)
         return rendered
 
     def prompt_meta_field(self, name: str, field: MetaField) -> Any:
-        prompt = field.prompt or name.replace('_', ' ').capitalize()
+        prompt = field.prompt or _humanize(name)
         extra = field._extra_prompt()
         if extra:
             prompt += f' ({extra})'
@@ -1,8 +1,11 @@
-from typing import Literal
+from __future__ import annotations
 
-from jinja2 import TemplateError
+from typing import TYPE_CHECKING, Literal
 
-from .render.path import TempPath
+if TYPE_CHECKING:
+    from jinja2 import TemplateError
+
+    from .render.path import TempPath
 
 
 class TexJamException(Exception):
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
-import json
+import os
+import re
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from importlib.util import module_from_spec, spec_from_file_location
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
-import yaml
-from jinja2 import Environment, TemplateError
+from jinja2 import Environment, Template, TemplateError
 from rich import print
 
 from .. import exception as exc
-from ..config import MetaField, Prompter, TexJamConfig
+from ..config import MetaField, Prompter, TexJamConfig, load_config
 from .path import TempPath
 
+_HOOKS = (
+    'pre_prompt',
+    'post_prompt',
+    'initialize',
+    'on_paths',
+    'pre_create',
+    'on_render',
+    'post_create',
+    'finalize',
+)
+
+# names the Jinja parser reads as literals rather than variables
+_JINJA_CONSTANTS = frozenset(('true', 'false', 'none', 'True', 'False', 'None'))
+
 
 class TexJam:
     """A class to scaffold LaTeX documents using Jinja2 templates."""
@@ -47,13 +66,7 @@ class TexJam:
         if config_file is None:
             raise exc.TexJamScaffoldConfigNotFoundException()
 
-        with config_file.open('r', encoding='utf-8') as f:
-            if config_file.suffix in ['.yaml', '.yml']:
-                config_data = yaml.safe_load(f)
-            else:
-                config_data = json.load(f)
-
-        self.config = TexJamConfig.model_validate(config_data)
+        self.config = load_config(config_file)
 
     @property
     def template_source_dir(self) -> Path:
@@ -65,6 +78,69 @@ class TexJam:
         """The plugins directory of the template."""
         return self.template_dir / self.config.plugin_dir
 
+    def compile_template(self, source: str) -> Template:
+        """Compile a template string, reusing previously compiled templates.
+
+        Args:
+            source (str): The template source.
+
+        Returns:
+            Template: The compiled Jinja2 template.
+        """
+        template = self._templates.get(source)
+        if template is None:
+            template = self.env.from_string(source)
+            self._templates[source] = template
+        return template
+
+    def needs_render(self, source: str) -> bool:
+        """Check whether rendering a string could change it.
+
+        Args:
+            source (str): The template source.
+
+        Returns:
+            bool: False if the source renders to itself, True otherwise.
+        """
+        if any(marker in source for marker in self._markers):
+            return True
+        # the lexer rewrites line endings to the configured newline sequence
+        # and drops a single trailing newline unless told to keep it
+        newline = self.env.newline_sequence
+        if newline == '\n':
+            # the default; avoid copying the source just to look for '\r'
+            if '\r' in source:
+                return True
+        else:
+            rest = source.replace(newline, '')
+            if '\r' in rest or '\n' in rest:
+                return True
+        if not self.env.keep_trailing_newline and source.endswith(('\n', '\r')):
+            return True
+        return False
+
+    def _render_part(self, part: str) -> str:
+        """Render a single part of a template path.
+
+        Args:
+            part (str): The path part.
+
+        Returns:
+            str: The rendered path part.
+        """
+        if not self.needs_render(part):
+            return part
+        if self._variable_only is not None:
+            # a lone variable renders as its value, no template needed
+            match = self._variable_only.fullmatch(part)
+            if (
+                match is not None
+                and match[1] in self.metadata
+                and match[1] not in _JINJA_CONSTANTS
+            ):
+                return str(self.metadata[match[1]])
+        return self.compile_template(part).render(self.metadata)
+
     def jinja_render(self, content: str) -> str:
         """Render content using the Jinja2 environment.
 
@@ -75,7 +151,7 @@ class TexJam:
             str: The rendered content.
         """
         try:
-            template = self.env.from_string(content)
+            template = self.compile_template(content)
             return template.render(self.metadata)
         except TemplateError as e:
             raise exc.TexJamTemplateStringException(template_string=content, cause=e)
@@ -83,24 +159,93 @@ class TexJam:
     def load_plugins(self) -> None:
         """Load plugins."""
         if not self.template_plugin_dir.exists():
+            self._plugin_classes = []
             self.plugins = []
 
         else:
+            # namespace plugin modules per template so that scripts with the
+            # same name in different templates do not replace each other
+            digest = blake2b(str(self.template_dir).encode(), digest_size=8)
+            prefix = f'_texjam_plugin_{digest.hexdigest()}_'
+
+            modules = []
             for script_file in self.template_plugin_dir.glob('*.py'):
-                module_name = script_file.stem
+                module_name = prefix + script_file.stem
+                st = script_file.stat()
+                version = (st.st_mtime_ns, st.st_size)
+                module = sys.modules.get(module_name)
+                if (
+                    module is not None
+                    and getattr(module, '_texjam_version', None) == version
+                ):
+                    # unchanged since it was last executed, reuse it
+                    modules.append(module)
+                    continue
+
                 spec = spec_from_file_location(module_name, script_file)
                 if spec and spec.loader:
+                    # forget classes a previous version of the script defined
+                    for key, plugin_cls in list(TexJamPlugin.plugins.items()):
+                        if plugin_cls.__module__ == module_name:
+                            del TexJamPlugin.plugins[key]
                     module = module_from_spec(spec)
                     sys.modules[module_name] = module
                     spec.loader.exec_module(module)
+                    module._texjam_version = version
+                    modules.append(module)
+
+            # the registry is shared by every template loaded in this process,
+            # so only take the classes this template's scripts define or import
+            exposed = {
+                value
+                for module in modules
+                for value in vars(module).values()
+                if isinstance(value, type) and issubclass(value, TexJamPlugin)
+            }
+            self._plugin_classes: list[type[TexJamPlugin]] = [
+                plugin_cls
+                for plugin_cls in TexJamPlugin.plugins.values()
+                if plugin_cls in exposed
+            ]
 
             self.plugins: list[TexJamPlugin] = []
-            for plugin_cls in TexJamPlugin.plugins:
+            for plugin_cls in self._plugin_classes:
                 plugin_instance = plugin_cls(texjam=self)
                 plugin_instance.on_load()
                 self.plugins.append(plugin_instance)
 
+        # bound hook methods of the plugins that override them
+        self._hooks: dict[str, list[Callable[..., Any]]] = {
+            hook: [
+                getattr(plugin, hook)
+                for plugin in self.plugins
+                if getattr(type(plugin), hook) is not getattr(TexJamPlugin, hook)
+            ]
+            for hook in _HOOKS
+        }
+
         self.env = Environment(**self.config.jinja.model_dump())
+        self._templates: dict[str, Template] = {}
+        self._markers = tuple(
+            marker
+            for marker in (
+                self.env.block_start_string,
+                self.env.variable_start_string,
+                self.env.comment_start_string,
+                self.env.line_statement_prefix,
+                self.env.line_comment_prefix,
+            )
+            if marker
+        )
+        # matches a part that is exactly one variable, like `(((name)))`;
+        # autoescaping would turn such a lookup into Markup, so skip it then
+        self._variable_only = None
+        if not self.env.autoescape:
+            self._variable_only = re.compile(
+                re.escape(self.env.variable_start_string)
+                + r'\s*([A-Za-z_][A-Za-z0-9_]*)\s*'
+                + re.escape(self.env.variable_end_string)
+            )
 
     def prompt(self, data: dict | None = None) -> None:
         """Prompt the user for metadata values."""
@@ -116,8 +261,8 @@ class TexJam:
         for name, field in self.config.meta.items():
             # pre-prompt hook
             skip_prompt = False
-            for plugin in self.plugins:
-                result = plugin.pre_prompt(name, field)
+            for pre_prompt in self._hooks['pre_prompt']:
+                result = pre_prompt(name, field)
                 if result is True:
                     skip_prompt = True
                     break
@@ -132,8 +277,8 @@ class TexJam:
 
             # post-prompt hook
             intercept_store = False
-            for plugin in self.plugins:
-                result = plugin.post_prompt(name, field, value)
+            for post_prompt in self._hooks['post_prompt']:
+                result = post_prompt(name, field, value)
                 if result is True:
                     intercept_store = True
                     break
@@ -149,8 +294,8 @@ class TexJam:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # initialize plugins
-        for plugin in self.plugins:
-            plugin.initialize()
+        for initialize in self._hooks['initialize']:
+            initialize()
 
         # gather template paths
         if not self.template_source_dir.exists():
@@ -159,76 +304,161 @@ class TexJam:
             )
 
         temp_paths = []
-        for path in self.template_source_dir.rglob('*'):
-            if path.is_file() or path.is_dir():
-                relative_path = path.relative_to(self.template_source_dir)
-                parts = [
-                    self.env.from_string(part).render(self.metadata)
-                    for part in relative_path.parts
-                ]
-                if any(part == '' for part in parts):
-                    continue  # skip paths with empty parts
-                rendered_path = Path(*parts)
-                temp_path = TempPath(raw=path, rendered=rendered_path)
-                temp_paths.append(temp_path)
-
-        for plugin in self.plugins:
-            modified_paths = plugin.on_paths(temp_paths)
+        # bound once for the walk, which looks it up for every entry
+        render_part = self._render_part
+
+        # directories are queued with their rendered path, so every name in
+        # the tree is rendered exactly once
+        pending = [(self.template_source_dir, Path())]
+        while pending:
+            directory, rendered_dir = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # entry types come from the directory listing; like rglob,
+                    # symlinked directories are listed but not descended into
+                    is_dir = entry.is_dir()
+                    if not is_dir and not entry.is_file():
+                        continue
+
+                    name = render_part(entry.name)
+                    if name == '':
+                        continue  # skip paths with empty parts, and their children
+
+                    path = Path(entry.path)
+                    rendered_path = rendered_dir / name
+                    if is_dir and not entry.is_symlink():
+                        pending.append((path, rendered_path))
+                    temp_path = TempPath(
+                        raw=path, rendered=rendered_path, is_dir=is_dir
+                    )
+                    temp_paths.append(temp_path)
+
+        for on_paths in self._hooks['on_paths']:
+            modified_paths = on_paths(temp_paths)
             if modified_paths is not None:
                 temp_paths = modified_paths
 
         # create files and directories
-        for temp_path in sorted(temp_paths, key=lambda p: p.rendered):
-            for plugin in self.plugins:
-                plugin.pre_create(temp_path)
-
-            target_path = self.output_dir / temp_path.rendered
-            if temp_path.is_dir:
-                if target_path.exists():
-                    raise exc.TexJamScaffoldPathAlreadyExistsException(path=temp_path)
+        # parts tuples compare in C, unlike PurePath.__lt__
+        temp_paths = sorted(temp_paths, key=attrgetter('rendered.parts'))
+        create_path = self._create_path
+        if any(
+            self._hooks[hook] for hook in ('pre_create', 'on_render', 'post_create')
+        ) or len({p.rendered.parts for p in temp_paths}) != len(temp_paths):
+            # per-path hooks see paths one at a time, in order; paths that
+            # render to the same target must also be written in order so the
+            # last one wins
+            for temp_path in temp_paths:
+                create_path(temp_path)
+        else:
+            # directories first so every parent exists, then the files, which
+            # do not depend on each other
+            files = []
+            for temp_path in temp_paths:
+                if temp_path.is_dir:
+                    create_path(temp_path)
                 else:
-                    target_path.mkdir(parents=True, exist_ok=False)
-            else:
-                if not target_path.parent.exists():
-                    # Parent directory does not exist.
-                    # This should not happen because paths are sorted
-                    # so that parent directories are created first.
-                    raise RuntimeError(
-                        f'Parent directory {target_path.parent} does not exist.'
-                    )
+                    files.append(temp_path)
+            with ThreadPoolExecutor() as executor:
+                # consume the results to re-raise errors from the workers
+                list(executor.map(create_path, files))
 
-                # render content
-                content = temp_path.content
-                if isinstance(content, str):
-                    template = self.env.from_string(content)
-                    rendered_content = template.render(self.metadata)
-                    for plugin in self.plugins:
-                        modified_content = plugin.on_render(temp_path, rendered_content)
-                        if modified_content is not None:
-                            rendered_content = modified_content
-                    target_path.write_text(rendered_content, encoding='utf-8')
-                else:
-                    target_path.write_bytes(content)
+        # finalize plugins
+        for finalize in self._hooks['finalize']:
+            finalize()
 
-            if temp_path.mode is not None:
-                target_path.chmod(temp_path.mode)
+    def _create_path(self, temp_path: TempPath) -> None:
+        """Create a single directory or render and write a single file.
 
-            for plugin in self.plugins:
-                plugin.post_create(temp_path)
+        Args:
+            temp_path (TempPath): The path to create.
+        """
+        for pre_create in self._hooks['pre_create']:
+            pre_create(temp_path)
+
+        target_path = self.output_dir / temp_path.rendered
+        if temp_path.is_dir:
+            try:
+                target_path.mkdir(parents=True, exist_ok=False)
+            except FileExistsError:
+                raise exc.TexJamScaffoldPathAlreadyExistsException(
+                    path=temp_path
+                ) from None
+        else:
+            try:
+                self._write_file(temp_path, target_path)
+            except FileNotFoundError as e:
+                if target_path.parent.exists():
+                    raise
+                # Parent directory does not exist.
+                # This should not happen because paths are sorted
+                # so that parent directories are created first.
+                raise RuntimeError(
+                    f'Parent directory {target_path.parent} does not exist.'
+                ) from e
+
+        if temp_path.mode is not None:
+            target_path.chmod(temp_path.mode)
+
+        for post_create in self._hooks['post_create']:
+            post_create(temp_path)
+
+    def _write_file(self, temp_path: TempPath, target_path: Path) -> None:
+        """Render a file and write it to the target path.
 
-        # finalize plugins
-        for plugin in self.plugins:
-            plugin.finalize()
+        Args:
+            temp_path (TempPath): The file to write.
+            target_path (Path): The output file.
+        """
+        if temp_path.is_binary:
+            # binary files are copied as they are
+            temp_path.copy_to(target_path)
+        else:
+            # render content
+            on_render = self._hooks['on_render']
+            metadata = self.metadata
+            content = temp_path.content
+            template = None
+            if self.needs_render(content):
+                template = self.compile_template(content)
+
+            if template is not None and not on_render:
+                # no hook needs the whole output, so stream it to disk; go
+                # through a sibling file so a failing template leaves no
+                # partial output behind
+                partial_path = target_path.with_name(
+                    f'.{target_path.name}.{uuid4().hex}.partial'
+                )
+                fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                try:
+                    with open(fd, 'w', encoding='utf-8') as f:
+                        template.stream(metadata).dump(f)
+                    os.replace(partial_path, target_path)
+                except BaseException:
+                    partial_path.unlink(missing_ok=True)
+                    raise
+            else:
+                if template is not None:
+                    rendered_content = template.render(metadata)
+                else:
+                    rendered_content = content
+                for hook in on_render:
+                    modified_content = hook(temp_path, rendered_content)
+                    if modified_content is not None:
+                        rendered_content = modified_content
+                target_path.write_text(rendered_content, encoding='utf-8')
 
 
 class TexJamPlugin:
     """Abstract base class for TeXJam plugins."""
 
-    plugins = []
+    # keyed by qualified name, so re-executing a plugin script replaces its
+    # classes instead of registering them again
+    plugins: dict[str, type[TexJamPlugin]] = {}
 
     def __init_subclass__(cls) -> None:
         if not cls.__name__.startswith('_'):
-            cls.plugins.append(cls)
+            cls.plugins[f'{cls.__module__}.{cls.__qualname__}'] = cls
         return super().__init_subclass__()
 
     def __init__(self, *, texjam: TexJam) -> None:
@@ -258,7 +488,7 @@ class TexJamPlugin:
         Returns:
             str: The rendered content.
         """
-        template = self.texjam.env.from_string(content)
+        template = self.texjam.compile_template(content)
         return template.render(self.metadata)
 
     def on_load(self) -> None:
@@ -299,8 +529,10 @@ class TexJamPlugin:
             paths (list[TempPath]): The list of TempPath objects to be processed.
 
         Returns:
-            list[TempPath] | None: The modified list of TempPath objects,
-            or None to leave unchanged.
+            list[TempPath] | None: A replacement list of TempPath objects,
+            or None to keep the current list. Plugins that only append,
+            remove or edit entries can mutate `paths` in place and
+            return None.
         """
         pass
 
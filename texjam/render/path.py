@@ -1,14 +1,34 @@
+import os
+import shutil
+import stat
 from pathlib import Path
 from typing import overload
 
-from binaryornot.check import is_binary
+# number of leading bytes searched for NUL bytes when sniffing binary files
+_SNIFF_SIZE = 8192
+
+
+def _decode(data: bytes) -> str | bytes:
+    """Decode file content as UTF-8 text, keeping binary content as bytes."""
+    if b'\x00' in data[:_SNIFF_SIZE]:
+        return data
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data
+    # normalize newlines the same way text-mode reads do
+    return text.replace('\r\n', '\n').replace('\r', '\n')
 
 
 class TempPath:
     """A class representing a template file or directory path."""
 
+    __slots__ = ('raw', 'rendered', '_is_dir', '_mode', '_content', '_stat')
+
     @overload
-    def __init__(self, *, raw: Path, rendered: Path) -> None: ...
+    def __init__(
+        self, *, raw: Path, rendered: Path, is_dir: bool | None = None
+    ) -> None: ...
 
     @overload
     def __init__(
@@ -40,6 +60,16 @@ class TempPath:
         self._is_dir = is_dir
         self._mode = mode
         self._content = content
+        self._stat: os.stat_result | None = None
+
+    def _raw_stat(self) -> os.stat_result | None:
+        """Stat the raw path once and cache the result."""
+        if self._stat is None and self.raw is not None:
+            try:
+                self._stat = self.raw.stat()
+            except OSError:
+                return None
+        return self._stat
 
     @property
     def is_dir(self) -> bool:
@@ -47,7 +77,8 @@ class TempPath:
         if self._is_dir is not None:
             return self._is_dir
         if self.raw:
-            self._is_dir = self.raw.is_dir()
+            st = self._raw_stat()
+            self._is_dir = st is not None and stat.S_ISDIR(st.st_mode)
             return self._is_dir
         raise ValueError('is_dir is not available.')
 
@@ -61,8 +92,9 @@ class TempPath:
         """Get the file mode, if applicable."""
         if self._mode is not None:
             return self._mode
-        if self.raw and self.raw.exists():
-            self._mode = self.raw.stat().st_mode
+        st = self._raw_stat()
+        if st is not None:
+            self._mode = st.st_mode
             return self._mode
         return None
 
@@ -78,11 +110,8 @@ class TempPath:
             raise ValueError('Directories do not have content.')
         if self._content is not None:
             return self._content
-        if self.raw and self.raw.exists():
-            if is_binary(str(self.raw)):
-                self._content = self.raw.read_bytes()
-            else:
-                self._content = self.raw.read_text(encoding='utf-8')
+        if self.raw and self._raw_stat() is not None:
+            self._content = _decode(self.raw.read_bytes())
             return self._content
         raise ValueError('Content is not available.')
 
@@ -91,6 +120,35 @@ class TempPath:
         """Set the content of the file."""
         self._content = value
 
+    @property
+    def is_binary(self) -> bool:
+        """Determine if the file has binary content."""
+        if self._content is None and self.raw is not None and not self.is_dir:
+            try:
+                with self.raw.open('rb') as f:
+                    head = f.read(_SNIFF_SIZE)
+                    if b'\x00' in head:
+                        # settled by the head alone, leave the rest unread
+                        return True
+                    self._content = _decode(head + f.read())
+            except OSError:
+                pass
+        return isinstance(self.content, bytes)
+
+    def copy_to(self, target: Path) -> None:
+        """Write the binary content of the file to a target path.
+
+        Raw files whose content has not been loaded are copied directly,
+        without reading them into memory.
+
+        Args:
+            target (Path): The file to write.
+        """
+        if self._content is None and self.raw is not None:
+            shutil.copyfile(self.raw, target)
+        else:
+            target.write_bytes(self.content)
+
     def __repr__(self) -> str:
         if self.raw is None:
             return f'"{self.rendered.as_posix()}"'